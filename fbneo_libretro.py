@@ -1,23 +1,62 @@
 import sys
 import os
 import subprocess
-import json
 import time
+import bisect
+import hashlib
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-import xml.etree.ElementTree as ET
+from types import SimpleNamespace
 import warnings
 
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+    # numpy.strings (NumPy 2) supersedes the legacy numpy.char functions.
+    np_str_find = np.strings.find if hasattr(np, "strings") else np.char.find
+except ImportError:
+    HAVE_NUMPY = False
+
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # Suppress pkg_resources deprecation warning from pygame dependencies
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="pkg_resources")
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QLineEdit, QPushButton, QLabel, QFileDialog, QMessageBox,
+    QListView, QLineEdit, QPushButton, QLabel, QFileDialog, QMessageBox,
     QDialog, QFormLayout, QComboBox, QGroupBox, QScrollArea, QSizePolicy,
     QTabWidget, QSplitter, QCheckBox, QMenu
 )
-from PyQt6.QtCore import QTimer, Qt, QEvent
-from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtCore import (
+    QTimer, Qt, QEvent, QStringListModel, QFileSystemWatcher, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QPixmapCache
 
 import pygame
 
@@ -42,6 +81,7 @@ TAB_CONFIGS = [
 ]
 
 CONFIG_FILE = Path("config.json")
+FAVORITES_FILE = Path("favorites.json")
 DEFAULT_CONFIG = {
     "RETROARCH": "",
     "RETROARCH_CORE": "",
@@ -62,13 +102,13 @@ DEFAULT_CONFIG = {
     },
     "display_only_rom_list": False,
     "hide_clones": False,
+    "search_prefix_only": False,
     "favorites": []
 }
 
 def load_config():
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
+        cfg = json_loads(CONFIG_FILE.read_bytes())
         jc = cfg.get("joystick_config", {})
         jc.setdefault("hat_fastest_steps", 10)
         jc.setdefault("hat_fastest_delay", 0.02)
@@ -80,129 +120,385 @@ def load_config():
             cfg["display_only_rom_list"] = False
         if "hide_clones" not in cfg:
             cfg["hide_clones"] = False
-        if "favorites" not in cfg:
-            cfg["favorites"] = []
-        return cfg
+        if "search_prefix_only" not in cfg:
+            cfg["search_prefix_only"] = False
     else:
         save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG.copy()
+        cfg = DEFAULT_CONFIG.copy()
+    if FAVORITES_FILE.exists():
+        cfg["favorites"] = json_loads(FAVORITES_FILE.read_bytes())
+    else:
+        # Favorites used to be stored in config.json; move them to their own file once.
+        cfg["favorites"] = list(cfg.get("favorites", []))
+        save_favorites(cfg)
+    return cfg
 
 def save_config(cfg):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=4)
+    """Write config.json. Favorites are kept in FAVORITES_FILE, see save_favorites."""
+    CONFIG_FILE.write_bytes(json_dumps({k: v for k, v in cfg.items() if k != "favorites"}))
+
+def save_favorites(cfg):
+    tmp_path = FAVORITES_FILE.with_name(FAVORITES_FILE.name + ".tmp")
+    tmp_path.write_bytes(json_dumps(cfg["favorites"]))
+    os.replace(tmp_path, FAVORITES_FILE)
+
+CACHE_DIR = Path.home() / ".cache" / "fbneo_libretro"
+# Bump when the layout or parsing of cached data changes so stale cache files are ignored.
+CACHE_VERSION = 3
+
+def file_stamp(path):
+    """Return (mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def disk_cache_path(kind, *key_parts):
+    digest = hashlib.sha1("|".join((str(CACHE_VERSION), kind) + key_parts).encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{kind}_{digest}.pkl"
+
+def load_disk_cache(cache_path, stamp):
+    """Return the data pickled at cache_path if it was stored with the same stamp, else None."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+    except Exception:
+        return None
+    return data if cached_stamp == stamp else None
+
+def save_disk_cache(cache_path, stamp, data):
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Failed to write cache {cache_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+BAD_TITLES = frozenset({"untitled", "unknown", "no title"})
 
 def load_rom_titles(filename: str):
     rom_titles = {}
     if not os.path.exists(filename):
         return rom_titles
-    with open(filename, "r", encoding="utf-8") as file:
+    stamp = file_stamp(filename)
+    cache_path = disk_cache_path("titles", os.path.abspath(filename))
+    cached = load_disk_cache(cache_path, stamp)
+    if cached is not None:
+        return cached
+    with open(filename, "r", encoding="utf-8", buffering=1 << 20) as file:
         for line in file:
-            parts = line.strip().split(maxsplit=1)
-            if len(parts) >= 2:
-                key = parts[0].lower()
-                title = parts[1].strip('"')
-                if not title or title.lower() in {"untitled", "unknown", "no title"}:
-                    continue
-                rom_titles[key] = title
+            parts = line.strip().split(None, 1)
+            if len(parts) < 2:
+                continue
+            key, title = parts
+            title = title.strip('"')
+            if not title or title.lower() in BAD_TITLES:
+                continue
+            rom_titles[key.lower()] = title
+    save_disk_cache(cache_path, stamp, rom_titles)
     return rom_titles
 
+DAT_ENTRY_TAGS = ("game", "machine")
+
+def iter_dat_entries(xml_path):
+    """
+    Yield the <game>/<machine> elements of an XML/DAT file one at a time.
+    Each element is cleared (and detached from the tree) once the caller is done with it.
+    """
+    if HAVE_LXML:
+        for _, entry in ET.iterparse(xml_path, events=("end",), tag=DAT_ENTRY_TAGS):
+            yield entry
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+    else:
+        context = ET.iterparse(xml_path, events=("start", "end"))
+        _, root = next(context)
+        for event, entry in context:
+            if event != "end" or entry.tag not in DAT_ENTRY_TAGS:
+                continue
+            yield entry
+            entry.clear()
+            root.clear()
+
 def parse_dat_metadata(xml_path):
     """
     Parse the XML/DAT file and return a meta dictionary excluding <game isbios="yes"> entries.
     Each entry maps rom name -> (title, year, manufacturer, is_clone).
+    The file is streamed with iterparse (lxml when available), so memory stays
+    bounded by a single entry instead of the whole document.
+    Parsed results are cached on disk and reused until the file changes.
     """
     meta = {}
     if not xml_path or not os.path.exists(xml_path):
         return meta
+    stamp = file_stamp(xml_path)
+    cache_path = disk_cache_path("meta", os.path.abspath(xml_path))
+    cached = load_disk_cache(cache_path, stamp)
+    if cached is not None:
+        return cached
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        for entry in root.findall(".//game") + root.findall(".//machine"):
+        for entry in iter_dat_entries(xml_path):
             if entry.attrib.get("isbios", "no") == "yes":
                 continue
             name = entry.attrib.get("name") or entry.attrib.get("romname") or ""
-            title_node = entry.find("description")
-            year_node = entry.find("year")
-            manuf_node = entry.find("manufacturer")
-            title = title_node.text.strip() if title_node is not None and title_node.text else name
-            year = year_node.text.strip() if year_node is not None and year_node.text else ""
-            manuf = manuf_node.text.strip() if manuf_node is not None and manuf_node.text else ""
+            title = (entry.findtext("description") or "").strip() or name
+            year = (entry.findtext("year") or "").strip()
+            manuf = (entry.findtext("manufacturer") or "").strip()
             is_clone = "cloneof" in entry.attrib
             if name:
                 meta[name.lower()] = (title, year, manuf, is_clone)
+        save_disk_cache(cache_path, stamp, meta)
     except Exception as e:
         print(f"Failed to parse {xml_path}: {e}")
+        # A partial table would hide every ROM listed after the bad spot; fall back to showing them all.
+        meta = {}
     return meta
 
-ROM_HIDE_LIST = {"neocdz", "rom_to_hide2"}
+ROM_HIDE_LIST = frozenset({"neocdz", "rom_to_hide2"})
+ROM_EXTENSIONS = (".zip", ".7z", ".cue")
+
+# directory -> {lowercase name: real name}
+# Listings are kept until invalidate_dir_index is called for the directory,
+# which MainWindow does from a QFileSystemWatcher when the folder changes.
+_dir_index_cache = {}
 
 def find_file_case_insensitive(directory, filename):
-    if not directory or not os.path.isdir(directory):
+    if not directory:
         return None
-    for f in os.listdir(directory):
-        if f.lower() == filename.lower():
-            return os.path.join(directory, f)
-    return None
+    index = _dir_index_cache.get(directory)
+    if index is None:
+        index = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    index.setdefault(entry.name.lower(), entry.name)
+        except OSError:
+            return None
+        _dir_index_cache[directory] = index
+    name = index.get(filename.lower())
+    return os.path.join(directory, name) if name else None
+
+def invalidate_dir_index(directory):
+    _dir_index_cache.pop(directory, None)
+
+def scan_rom_files(directory, extensions, recursive=False, prefix=""):
+    """
+    Yield ROM file names in directory whose lowercase name ends with one of extensions.
+    With recursive=True subfolders are scanned too and paths are relative to directory.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if recursive and entry.is_dir(follow_symlinks=False):
+                try:
+                    yield from scan_rom_files(entry.path, extensions, True, os.path.join(prefix, entry.name))
+                except OSError:
+                    # Skip unreadable subfolders, as os.walk does.
+                    continue
+            elif entry.name.lower().endswith(extensions) and entry.is_file():
+                yield os.path.join(prefix, entry.name) if prefix else entry.name
 
-def get_rom_list_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, cache_dict):
-    cache_key = (roms_dir, system_name, xml_dat_file)
-    cache = cache_dict.get(cache_key)
-    if cache is not None:
-        return cache
+class RomList(list):
+    """
+    Sorted ROM tuples (rom, title, year, manuf, is_clone, title_lc, manuf_lc),
+    plus each ROM's list text, formatted once here rather than on every filter change.
+    When numpy is available, also holds column arrays (titles_lc, manufs_lc, years, is_clone)
+    that filter_rom_indices scans with vectorized operations instead of a Python loop.
+    Text columns are stored UTF-8 encoded, which keeps substring matches intact at a quarter of the memory.
+    """
+    def __init__(self, rows=()):
+        super().__init__(rows)
+        self.titles_lc = [r[5] for r in self]
+        self.display_texts = [rom_display_text(r[1], r[2], r[3]) for r in self]
+        self.columns = None
+        if HAVE_NUMPY:
+            self.columns = (
+                np.array([r[5].encode("utf-8") for r in self], dtype=bytes),
+                np.array([r[6].encode("utf-8") for r in self], dtype=bytes),
+                np.array([r[2].encode("utf-8") for r in self], dtype=bytes),
+                np.array([r[4] for r in self], dtype=bool),
+            )
+            self.parent_indices = np.flatnonzero(~self.columns[3])
+
+    def select(self, indices):
+        """Return the ROM tuples and list texts at the positions from filter_rom_indices."""
+        if isinstance(indices, range):
+            return self[indices.start:indices.stop], self.display_texts[indices.start:indices.stop]
+        if self.columns is not None:
+            indices = indices.tolist()
+        return [self[i] for i in indices], [self.display_texts[i] for i in indices]
+
+def build_rom_list(rom_titles_file, roms_dir, system_name, xml_dat_file):
+    if not roms_dir or not os.path.exists(roms_dir):
+        return RomList()
+    # Neo-Geo CD scans subfolders, whose changes don't touch the top folder's mtime.
+    disk_cache = system_name != "SNK Neo-Geo CD"
+    if disk_cache:
+        stamp = (file_stamp(roms_dir), file_stamp(rom_titles_file), file_stamp(xml_dat_file) if xml_dat_file else None)
+        cache_path = disk_cache_path("roms", system_name, os.path.abspath(roms_dir), os.path.abspath(rom_titles_file), xml_dat_file or "")
+        cached = load_disk_cache(cache_path, stamp)
+        if cached is not None:
+            return RomList(cached)
     rom_titles = load_rom_titles(rom_titles_file)
     meta = parse_dat_metadata(xml_dat_file) if xml_dat_file else {}
-    if not roms_dir or not os.path.exists(roms_dir):
-        cache_dict[cache_key] = []
-        return []
-    roms = []
     if system_name == "SNK Neo-Geo CD":
-        for root, _, files in os.walk(roms_dir):
-            for f in files:
-                if f.lower().endswith('.cue'):
-                    rel_path = os.path.relpath(os.path.join(root, f), roms_dir)
-                    roms.append(rel_path)
+        roms = list(scan_rom_files(roms_dir, ".cue", recursive=True))
     else:
-        roms = [
-            f for f in os.listdir(roms_dir)
-            if os.path.isfile(os.path.join(roms_dir, f)) and f.lower().endswith(('.zip', '.7z', '.cue'))
-        ]
+        roms = list(scan_rom_files(roms_dir, ROM_EXTENSIONS))
+    neocd = system_name == "SNK Neo-Geo CD"
     rom_list = []
     for rom in roms:
-        stem = Path(rom).stem
-        if stem.lower() in ROM_HIDE_LIST:
-            continue
-        if system_name == "SNK Neo-Geo CD":
-            if stem.lower() in meta:
-                title, year, manuf, is_clone = meta[stem.lower()]
-            else:
-                title = rom_titles.get(stem.lower(), stem)
-                year, manuf, is_clone = "", "", False
-            rom_list.append((rom, title, year, manuf, is_clone))
-        else:
-            if meta and stem.lower() not in meta:
-                continue
-            if stem.lower() in meta:
-                title, year, manuf, is_clone = meta[stem.lower()]
-            else:
-                title = rom_titles.get(stem.lower(), stem)
-                year, manuf, is_clone = "", "", False
-            rom_list.append((rom, title, year, manuf, is_clone))
-    rom_list_sorted = sorted(rom_list, key=lambda x: x[1].lower())
-    cache_dict[cache_key] = rom_list_sorted
-    return rom_list_sorted
-
-def filter_rom_list(rom_list, search="", year_filter="", manuf_filter="", hide_clones=False):
-    filtered = []
-    for rom, title, year, manuf, is_clone in rom_list:
-        if hide_clones and is_clone:
-            continue
-        if year_filter and year_filter not in year:
+        stem = os.path.splitext(os.path.basename(rom))[0]
+        stem_lc = stem.lower()
+        if stem_lc in ROM_HIDE_LIST:
             continue
-        if manuf_filter and manuf_filter.lower() not in manuf.lower():
+        entry = meta.get(stem_lc)
+        if entry is not None:
+            title, year, manuf, is_clone = entry
+        elif meta and not neocd:
             continue
-        if not search or search in title.lower():
-            filtered.append((rom, title, year, manuf, is_clone))
-    return filtered
+        else:
+            title = rom_titles.get(stem_lc, stem)
+            year, manuf, is_clone = "", "", False
+        rom_list.append((rom, title, year, manuf, is_clone, title.lower(), manuf.lower()))
+    rom_list_sorted = sorted(rom_list, key=lambda x: x[5])
+    if disk_cache:
+        save_disk_cache(cache_path, stamp, rom_list_sorted)
+    return RomList(rom_list_sorted)
+
+# Guards creation of the per-key locks below; each key lock makes concurrent requests
+# for the same ROM list (UI thread vs. background warm-up) wait for one build.
+rom_cache_lock = threading.Lock()
+rom_cache_key_locks = {}
+
+def get_rom_list_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, cache_dict):
+    cache_key = (roms_dir, system_name, xml_dat_file)
+    cache = cache_dict.get(cache_key)
+    if cache is not None:
+        return cache
+    with rom_cache_lock:
+        key_lock = rom_cache_key_locks.setdefault(cache_key, threading.Lock())
+    with key_lock:
+        cache = cache_dict.get(cache_key)
+        if cache is None:
+            cache = build_rom_list(rom_titles_file, roms_dir, system_name, xml_dat_file)
+            cache_dict[cache_key] = cache
+    return cache
+
+def filter_rom_indices(rom_list, search="", year_filter="", manuf_filter="", hide_clones=False, prefix=False):
+    """
+    Return the positions in a RomList of the ROMs matching the filters, in list order,
+    tested against the lowercase title/manufacturer fields precomputed by build_rom_list.
+    The result is a range when nothing is filtered out, and is meant for RomList.select.
+    With numpy columns the filters run as boolean masks over the surviving positions.
+    With prefix=True the search matches the start of titles only, found by bisecting
+    the list (which is sorted by title_lc, as get_rom_list_cached returns it).
+    """
+    search = search.lower()
+    manuf_filter = manuf_filter.lower()
+    indices = range(len(rom_list))
+    if prefix and search:
+        lo = bisect.bisect_left(rom_list.titles_lc, search)
+        hi = bisect.bisect_left(rom_list.titles_lc, search + "\U0010ffff", lo)
+        indices = range(lo, hi)
+        search = ""
+    if not (search or year_filter or manuf_filter or hide_clones):
+        return indices
+    if rom_list.columns is not None:
+        titles_lc, manufs_lc, years, is_clone = rom_list.columns
+        # Each test only scans the rows that passed the previous ones.
+        idx = np.arange(indices.start, indices.stop) if len(indices) < len(rom_list) else None
+        if hide_clones:
+            idx = rom_list.parent_indices if idx is None else idx[~is_clone[idx]]
+        for column, needle in ((years, year_filter), (manufs_lc, manuf_filter), (titles_lc, search)):
+            if needle:
+                values = column if idx is None else column[idx]
+                hits = np_str_find(values, needle.encode("utf-8")) >= 0
+                idx = np.flatnonzero(hits) if idx is None else idx[hits]
+        return idx
+    # One comprehension per active filter, so each row only runs the tests that apply.
+    if hide_clones:
+        indices = [i for i in indices if not rom_list[i][4]]
+    if year_filter:
+        indices = [i for i in indices if year_filter in rom_list[i][2]]
+    if manuf_filter:
+        indices = [i for i in indices if manuf_filter in rom_list[i][6]]
+    if search:
+        indices = [i for i in indices if search in rom_list[i][5]]
+    return indices
+
+def rom_display_text(title, year, manuf):
+    display = title
+    if year:
+        display += f" [{year}]"
+    if manuf:
+        display += f" ({manuf})"
+    return display
+
+def favorite_display_text(fav):
+    if len(fav) == 4:
+        system_name, rom, title, year = fav
+        manuf = ""
+    else:
+        system_name, rom, title, year, manuf = fav[:5]
+    return rom_display_text(f"{title} [{system_name}]", year, manuf)
+
+def load_pixmap(path):
+    """Return the image at path, decoding it only if it is not already in QPixmapCache."""
+    # Keyed by path on purpose: from Python, a find() by QPixmapCache.Key is no faster than by string
+    # (the call overhead dominates), and string keys need no bookkeeping when entries are evicted.
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            QPixmapCache.insert(path, pixmap)
+    return pixmap
+
+class PixmapPrefetch(QRunnable):
+    def __init__(self, path, loaded):
+        super().__init__()
+        self.path = path
+        self.loaded = loaded
+
+    def run(self):
+        # QImage may be decoded on any thread; QPixmap and QPixmapCache belong to the GUI thread.
+        self.loaded.emit(self.path, QImage(self.path))
+
+class PixmapPrefetcher(QObject):
+    """Decode images on a worker thread and add them to QPixmapCache for load_pixmap to find."""
+    loaded = pyqtSignal(str, QImage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.pending = set()
+        self.loaded.connect(self.store)
+
+    def prefetch(self, paths):
+        """Queue paths for decoding, dropping queued paths from an earlier call that have not started."""
+        self.pool.clear()
+        self.pending.clear()
+        for path in paths:
+            if path not in self.pending and QPixmapCache.find(path) is None:
+                self.pending.add(path)
+                self.pool.start(PixmapPrefetch(path, self.loaded))
+
+    @pyqtSlot(str, QImage)
+    def store(self, path, image):
+        self.pending.discard(path)
+        if not image.isNull() and QPixmapCache.find(path) is None:
+            QPixmapCache.insert(path, QPixmap.fromImage(image))
+
+    def shutdown(self):
+        self.pool.clear()
+        self.pool.waitForDone()
 
 def run_rom(rom, roms_dir, retroarch, core, system_name, win):
     rom_path = os.path.join(roms_dir, rom)
@@ -231,17 +527,120 @@ def run_rom(rom, roms_dir, retroarch, core, system_name, win):
     except Exception as e:
         QMessageBox.critical(win, "Error", f"Failed to launch ROM: {e}")
 
+class JoystickInput:
+    """
+    Tracks the first joystick from the SDL event queue instead of polling its state.
+    Button presses arrive in order even when pressed and released between two reads,
+    and the device is reopened or dropped when it is plugged in or out.
+    The SDL queue must be pumped on the GUI thread, so read() is called from a QTimer.
+    """
+    STATE_EVENTS = (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYHATMOTION)
+
+    def __init__(self):
+        self.joystick = None
+        self.hat = (0, 0)
+        if pygame.joystick.get_count() > 0:
+            self.open(0)
+
+    def open(self, device_index):
+        self.joystick = pygame.joystick.Joystick(device_index)
+        self.joystick.init()
+        self.hat = self.joystick.get_hat(0) if self.joystick.get_numhats() > 0 else (0, 0)
+
+    def read(self):
+        """Consume pending events and return the button transitions as (button, pressed) pairs."""
+        buttons = []
+        for event in pygame.event.get():
+            if event.type in self.STATE_EVENTS:
+                # Only the opened joystick drives the UI; other connected pads are ignored.
+                if self.joystick is None or event.instance_id != self.joystick.get_instance_id():
+                    continue
+                if event.type == pygame.JOYBUTTONDOWN:
+                    buttons.append((event.button, True))
+                elif event.type == pygame.JOYBUTTONUP:
+                    buttons.append((event.button, False))
+                elif event.hat == 0:
+                    self.hat = event.value
+            elif event.type == pygame.JOYDEVICEADDED:
+                if self.joystick is None:
+                    self.open(event.device_index)
+            elif event.type == pygame.JOYDEVICEREMOVED:
+                if self.joystick is not None and event.instance_id == self.joystick.get_instance_id():
+                    self.joystick = None
+                    self.hat = (0, 0)
+        return buttons
+
+    def discard_pending(self):
+        """Drop button/hat events queued while no window was reading them and resync the hat."""
+        pygame.event.clear(self.STATE_EVENTS)
+        if self.joystick is not None and self.joystick.get_numhats() > 0:
+            self.hat = self.joystick.get_hat(0)
+
+@dataclass
+class RepeatState:
+    """Hold-to-repeat state of one scroll direction (hat or arrow key)."""
+    held: bool = False
+    next_fire_ns: int = 0
+
+    def advance(self, pressed, now, delay, interval):
+        """
+        Return True when the list should move: once on press, again after delay ns
+        of holding, then every interval ns until released. now is time.monotonic_ns().
+        """
+        if not pressed:
+            self.held = False
+            return False
+        if not self.held:
+            self.held = True
+            self.next_fire_ns = now + delay
+            return True
+        if now >= self.next_fire_ns:
+            self.next_fire_ns = now + interval
+            return True
+        return False
+
+class RowListView(QListView):
+    """QListView exposing the row-based helpers of QListWidget."""
+    currentRowChanged = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Rows are single lines of text, so one row's size stands for all of them;
+        # otherwise every model reset measures each row before the list can lay out.
+        self.setUniformItemSizes(True)
+
+    def setModel(self, model):
+        super().setModel(model)
+        self.selectionModel().currentRowChanged.connect(lambda current, previous: self.currentRowChanged.emit(current.row()))
+
+    def count(self):
+        return self.model().rowCount() if self.model() else 0
+
+    def currentRow(self):
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row):
+        self.setCurrentIndex(self.model().index(row, 0))
+
+    def moveCurrentRow(self, delta):
+        """Move the current row by delta rows, stopping at the first and last rows."""
+        last = self.count() - 1
+        row = self.currentRow() + delta
+        self.setCurrentRow(0 if row < 0 else last if row > last else row)
+
 class FavoritesDialog(QDialog):
-    def __init__(self, cfg, parent=None, current_system_callback=None):
+    def __init__(self, cfg, parent=None, favorites_changed_callback=None, joystick_input=None):
         super().__init__(parent)
         self.setWindowTitle("Favorite ROMs")
         self.cfg = cfg
-        self.current_system_callback = current_system_callback
+        self.favorites_changed_callback = favorites_changed_callback
         self.layout = QVBoxLayout(self)
 
-        self.favorites_list = QListWidget()
+        self.favorites_model = QStringListModel(self)
+        self.favorites_list = RowListView()
+        self.favorites_list.setModel(self.favorites_model)
         self.favorites_list.setMinimumWidth(420)
-        self.favorites_list.itemDoubleClicked.connect(self.launch_selected_favorite)
+        self.favorites_list.doubleClicked.connect(self.launch_selected_favorite)
         self.favorites_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.favorites_list.customContextMenuRequested.connect(self.show_context_menu)
         self.favorites_list.installEventFilter(self)
@@ -250,37 +649,28 @@ class FavoritesDialog(QDialog):
         self.update_favorites_list()
         self.setMinimumSize(460, 420)
 
-        self.joystick = pygame.joystick.Joystick(0) if pygame.joystick.get_count() > 0 else None
-        if self.joystick:
-            self.joystick.init()
-        self.last_hat = (0, 0)
-        self.last_hat_held = {"left": False, "right": False, "up": False, "down": False}
-        self.last_hat_held_time = {"left": 0, "right": 0, "up": 0, "down": 0}
-        self.last_button_states = {}
+        self.joystick_input = joystick_input or JoystickInput()
+        self.joystick_input.discard_pending()
+        self.hat_repeat = {"up": RepeatState(), "down": RepeatState()}
         self.last_button_times = {}
-        self.debounce_delay = self.cfg["joystick_config"].get("button_debounce_delay", 200)
+        self.debounce_ns = self.cfg["joystick_config"].get("button_debounce_delay", 200) * 1_000_000
+        self.polling_interval = 50
         self.timer = QTimer(self)
+        self.timer.setInterval(self.polling_interval)
         self.timer.timeout.connect(self.poll_joystick)
-        self.timer.start(200)
-        self.polling_interval = 50
+        if self.joystick_input.joystick:
+            self.timer.start()
+        QApplication.instance().applicationStateChanged.connect(self.on_application_state_changed)
+        self.finished.connect(self.on_finished)
+        # A new dialog is built for every opening, so free this one once it closes.
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.favorites_list.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.favorites_list.setFocus()
 
     def update_favorites_list(self):
-        self.favorites_list.clear()
-        for fav in self.cfg["favorites"]:
-            if len(fav) == 4:
-                system_name, rom, title, year = fav
-                manuf = ""
-            else:
-                system_name, rom, title, year, manuf = fav[:5]
-            display = f"{title} [{system_name}]"
-            if year or manuf:
-                display += f" [{year}]" if year else ""
-                display += f" ({manuf})" if manuf else ""
-            self.favorites_list.addItem(display)
+        self.favorites_model.setStringList([favorite_display_text(fav) for fav in self.cfg["favorites"]])
 
     def launch_selected_favorite(self, *args):
         idx = self.favorites_list.currentRow()
@@ -315,64 +705,66 @@ class FavoritesDialog(QDialog):
         else:
             title = fav[2]
         self.cfg["favorites"].pop(idx)
-        save_config(self.cfg)
+        if self.favorites_changed_callback:
+            self.favorites_changed_callback()
+        else:
+            save_favorites(self.cfg)
         self.update_favorites_list()
         QMessageBox.information(self, "Favorites", f"Removed '{title}' from favorites.")
 
+    def on_finished(self):
+        self.timer.stop()
+        QApplication.instance().applicationStateChanged.disconnect(self.on_application_state_changed)
+
+    def on_application_state_changed(self, state):
+        if state == Qt.ApplicationState.ApplicationActive and self.joystick_input.joystick and self.isVisible():
+            self.timer.start()
+        else:
+            self.timer.stop()
+
     def poll_joystick(self):
         if not self.isActiveWindow():
             return
-        pygame.event.pump()
+        buttons = self.joystick_input.read()
         jc = self.cfg["joystick_config"]
-        scroll_cooldown = jc.get("hat_scroll_cooldown", 0.08) * 1000
-        now = time.time() * 1000
+        scroll_cooldown = int(jc.get("hat_scroll_cooldown", 0.08) * 1_000_000_000)
+        now = time.monotonic_ns()
         list_widget = self.favorites_list
-        idx = list_widget.currentRow()
-        size = list_widget.count()
-
-        def scroll_list(direction, steps, held_key, held_time_key):
-            if direction:
-                time_elapsed = now - self.last_hat_held_time.get(held_key, 0)
-                if not self.last_hat_held.get(held_key, False) or time_elapsed >= scroll_cooldown:
-                    new_idx = max(0, idx - steps) if held_key == "up" else min(size - 1, idx + steps)
-                    list_widget.setCurrentRow(new_idx)
-                    self.last_hat_held_time[held_key] = now
-                    self.last_hat_held[held_key] = True
-            else:
-                self.last_hat_held[held_key] = False
-
-        if self.joystick and self.joystick.get_numhats() > 0:
-            hat = self.joystick.get_hat(0)
-            hat_up = hat[1] == 1
-            hat_down = hat[1] == -1
-
-            scroll_list(hat_up, 1, "up", "up")
-            scroll_list(hat_down, 1, "down", "down")
-
-            self.last_hat = hat
-
-        def check_button(btn_key, action):
-            idx = jc.get(btn_key, -1)
-            if idx < 0 or idx >= self.joystick.get_numbuttons():
-                return
-            pressed = self.joystick.get_button(idx)
-            last_state = self.last_button_states.get(btn_key, False)
-            last_time = self.last_button_times.get(btn_key, 0)
-            if pressed and not last_state:
-                if now - last_time >= self.debounce_delay:
-                    action()
+
+        # Row moves from the hat and buttons add up, so the selection changes once per tick.
+        delta = 0
+        hat = self.joystick_input.hat if self.joystick_input.joystick else (0, 0)
+        for direction, pressed, step in (("up", hat[1] == 1, -1), ("down", hat[1] == -1, 1)):
+            if self.hat_repeat[direction].advance(pressed, now, scroll_cooldown, scroll_cooldown):
+                delta += step
+
+        if buttons:
+            if self.check_button("button_up", buttons, now):
+                delta -= 1
+            if self.check_button("button_down", buttons, now):
+                delta += 1
+        if delta:
+            list_widget.moveCurrentRow(delta)
+        if buttons:
+            if self.check_button("button_select", buttons, now):
+                self.launch_selected_favorite()
+            if self.check_button("button_favorites", buttons, now):
+                self.close()
+
+    def check_button(self, btn_key, buttons, now):
+        """Return True if the button mapped to btn_key was pressed, at most once per debounce period."""
+        fired = False
+        button = self.cfg["joystick_config"].get(btn_key, -1)
+        for pressed_button, pressed in buttons:
+            if pressed_button != button:
+                continue
+            if pressed:
+                if now - self.last_button_times.get(btn_key, 0) >= self.debounce_ns:
+                    fired = True
                     self.last_button_times[btn_key] = now
-            elif not pressed and last_state:
+            else:
                 self.last_button_times[btn_key] = now
-            self.last_button_states[btn_key] = pressed
-
-        if self.joystick:
-            check_button("button_up", lambda: self.favorites_list.setCurrentRow(max(0, self.favorites_list.currentRow() - 1)))
-            check_button("button_down", lambda: self.favorites_list.setCurrentRow(min(self.favorites_list.count() - 1, self.favorites_list.currentRow() + 1)))
-            check_button("button_select", self.launch_selected_favorite)
-            check_button("button_favorites", self.close)
-
-        self.timer.start(self.polling_interval)
+        return fired
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.Type.KeyPress and obj == self.favorites_list:
@@ -382,11 +774,10 @@ class FavoritesDialog(QDialog):
         return super().eventFilter(obj, event)
 
 class SettingsDialog(QDialog):
-    def __init__(self, cfg, parent, current_system_callback, update_rom_list_callback):
+    def __init__(self, cfg, parent, update_rom_list_callback):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.cfg = cfg
-        self.current_system_callback = current_system_callback
         self.update_rom_list_callback = update_rom_list_callback
 
         scroll = QScrollArea(self)
@@ -397,7 +788,7 @@ class SettingsDialog(QDialog):
 
         general_group = QGroupBox("General")
         general_layout = QFormLayout()
-        self.retroarch_edit = QLineEdit(str(cfg["RETROARCH"]))
+        self.retroarch_edit = QLineEdit()
         self.retroarch_btn = QPushButton("Choose...")
         self.retroarch_btn.setMaximumWidth(80)
         self.retroarch_btn.clicked.connect(self.choose_retroarch)
@@ -405,7 +796,7 @@ class SettingsDialog(QDialog):
         retroarch_row.addWidget(self.retroarch_edit)
         retroarch_row.addWidget(self.retroarch_btn)
 
-        self.core_edit = QLineEdit(str(cfg["RETROARCH_CORE"]))
+        self.core_edit = QLineEdit()
         self.core_btn = QPushButton("Choose...")
         self.core_btn.setMaximumWidth(80)
         self.core_btn.clicked.connect(self.choose_core)
@@ -423,16 +814,15 @@ class SettingsDialog(QDialog):
 
         joystick_group = QGroupBox("Joystick Buttons")
         joystick_layout = QFormLayout()
-        jc = cfg["joystick_config"]
-        self.hat_scroll_cooldown = QLineEdit(str(jc.get("hat_scroll_cooldown", 0.08)))
-        self.hat_fastest_steps = QLineEdit(str(jc.get("hat_fastest_steps", 10)))
-        self.hat_fastest_delay = QLineEdit(str(jc.get("hat_fastest_delay", 0.02)))
-        self.button_up = QLineEdit(str(jc.get("button_up", 2)))
-        self.button_down = QLineEdit(str(jc.get("button_down", 3)))
-        self.button_select = QLineEdit(str(jc.get("button_select", 0)))
-        self.button_favorites = QLineEdit(str(jc.get("button_favorites", 7)))
-        self.button_prev_tab = QLineEdit(str(jc.get("button_prev_tab", 4)))
-        self.button_next_tab = QLineEdit(str(jc.get("button_next_tab", 5)))
+        self.hat_scroll_cooldown = QLineEdit()
+        self.hat_fastest_steps = QLineEdit()
+        self.hat_fastest_delay = QLineEdit()
+        self.button_up = QLineEdit()
+        self.button_down = QLineEdit()
+        self.button_select = QLineEdit()
+        self.button_favorites = QLineEdit()
+        self.button_prev_tab = QLineEdit()
+        self.button_next_tab = QLineEdit()
         joystick_layout.addRow("Hat Scroll Cooldown (s):", self.hat_scroll_cooldown)
         joystick_layout.addRow("Hat Fastest Steps (hold):", self.hat_fastest_steps)
         joystick_layout.addRow("Hat Fastest Delay (s):", self.hat_fastest_delay)
@@ -488,9 +878,11 @@ class SettingsDialog(QDialog):
         sys_layout.addRow("Preview Image Folder:", preview_img_row)
 
         self.display_only_rom_list_chk = QCheckBox("Display only the ROM list (hide title/preview tabs)")
-        self.display_only_rom_list_chk.setChecked(cfg.get("display_only_rom_list", False))
         sys_layout.addRow(self.display_only_rom_list_chk)
 
+        self.search_prefix_only_chk = QCheckBox("Match search from the start of titles only")
+        sys_layout.addRow(self.search_prefix_only_chk)
+
         sys_group.setLayout(sys_layout)
 
         self.save_btn = QPushButton("Save")
@@ -505,9 +897,28 @@ class SettingsDialog(QDialog):
         dlg_layout.addWidget(scroll)
         self.setLayout(dlg_layout)
 
-        self.update_sys_fields(self.sys_dropdown.currentIndex())
+        self.reset_from_cfg()
         self.setMinimumSize(460, 500)
 
+    def reset_from_cfg(self):
+        """Fill the fields from cfg, discarding edits left over from an earlier, unsaved opening."""
+        cfg = self.cfg
+        self.retroarch_edit.setText(str(cfg["RETROARCH"]))
+        self.core_edit.setText(str(cfg["RETROARCH_CORE"]))
+        jc = cfg["joystick_config"]
+        self.hat_scroll_cooldown.setText(str(jc.get("hat_scroll_cooldown", 0.08)))
+        self.hat_fastest_steps.setText(str(jc.get("hat_fastest_steps", 10)))
+        self.hat_fastest_delay.setText(str(jc.get("hat_fastest_delay", 0.02)))
+        self.button_up.setText(str(jc.get("button_up", 2)))
+        self.button_down.setText(str(jc.get("button_down", 3)))
+        self.button_select.setText(str(jc.get("button_select", 0)))
+        self.button_favorites.setText(str(jc.get("button_favorites", 7)))
+        self.button_prev_tab.setText(str(jc.get("button_prev_tab", 4)))
+        self.button_next_tab.setText(str(jc.get("button_next_tab", 5)))
+        self.display_only_rom_list_chk.setChecked(cfg.get("display_only_rom_list", False))
+        self.search_prefix_only_chk.setChecked(cfg.get("search_prefix_only", False))
+        self.update_sys_fields(self.sys_dropdown.currentIndex())
+
     def choose_retroarch(self):
         fname, _ = QFileDialog.getOpenFileName(self, "Select RetroArch Executable", "", "All Files (*)")
         if fname:
@@ -567,6 +978,7 @@ class SettingsDialog(QDialog):
         self.cfg["title_image_dirs"][sys_name] = self.title_img_edit.text()
         self.cfg["preview_image_dirs"][sys_name] = self.preview_img_edit.text()
         self.cfg["display_only_rom_list"] = self.display_only_rom_list_chk.isChecked()
+        self.cfg["search_prefix_only"] = self.search_prefix_only_chk.isChecked()
         save_config(self.cfg)
         self.update_rom_list_callback()
         self.accept()
@@ -667,6 +1079,8 @@ class MainWindow(QMainWindow):
         "SNK Neo-Geo Pocket": "ngp_",
         "ZX Spectrum": "spec_"
     }
+    # Rows above and below the selection whose images are decoded ahead of time.
+    IMAGE_PREFETCH_ROWS = 5
 
     def __init__(self):
         super().__init__()
@@ -676,31 +1090,48 @@ class MainWindow(QMainWindow):
         elif sys.platform.startswith("linux") and os.path.exists("icon.png"):
             self.setWindowIcon(QIcon("icon.png"))
 
+        QPixmapCache.setCacheLimit(65536)
         self.cfg = load_config()
+        # Favorites are stored as lists (that is how they come back from JSON); the set holds them as tuples.
+        self.favorites_set = set(map(tuple, self.cfg["favorites"]))
         self.is_active = True
         self.favorites_dialog = None
+        # Built on first use and reused afterwards.
+        self.about_dialog = None
+        self.settings_dialog = None
 
         self.systems_combo = QComboBox()
         self.systems_combo.addItems([c["name"] for c in TAB_CONFIGS])
+        self.systems_combo.currentIndexChanged.connect(self.update_system_context)
         self.systems_combo.currentIndexChanged.connect(self.update_rom_list)
+        self.update_system_context()
+
+        # Coalesce bursts of keystrokes in the filter fields into a single list rebuild.
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.update_rom_list)
 
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search ROMs...")
-        self.search_edit.textChanged.connect(self.update_rom_list)
+        self.search_edit.textChanged.connect(self.filter_timer.start)
 
         self.year_edit = QLineEdit()
         self.year_edit.setPlaceholderText("Year")
         self.year_edit.setMaximumWidth(80)
-        self.year_edit.textChanged.connect(self.update_rom_list)
+        self.year_edit.textChanged.connect(self.filter_timer.start)
 
         self.manuf_edit = QLineEdit()
         self.manuf_edit.setPlaceholderText("Manufacturer")
         self.manuf_edit.setMaximumWidth(150)
-        self.manuf_edit.textChanged.connect(self.update_rom_list)
+        self.manuf_edit.textChanged.connect(self.filter_timer.start)
 
-        self.roms_list = QListWidget()
+        # The list model lives in C++, so the view can lay out and draw rows without calling back into Python.
+        self.roms_model = QStringListModel(self)
+        self.roms_list = RowListView()
+        self.roms_list.setModel(self.roms_model)
         self.roms_list.setMinimumWidth(420)
-        self.roms_list.itemDoubleClicked.connect(self.launch_selected_rom)
+        self.roms_list.doubleClicked.connect(self.launch_selected_rom)
         self.roms_list.installEventFilter(self)
         self.roms_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.roms_list.customContextMenuRequested.connect(self.show_context_menu)
@@ -770,25 +1201,50 @@ class MainWindow(QMainWindow):
 
         self.roms = []
         self.rom_cache = {}
-        self.roms_list.currentRowChanged.connect(self.update_image_tabs)
+        self.last_filter_key = None
+        self.warm_stop = threading.Event()
+
+        # Favorites and config edits are written to disk once they stop changing for a moment;
+        # a running timer means there are unsaved changes.
+        self.favorites_save_timer = QTimer(self)
+        self.favorites_save_timer.setSingleShot(True)
+        self.favorites_save_timer.setInterval(500)
+        self.favorites_save_timer.timeout.connect(lambda: save_favorites(self.cfg))
+        self.config_save_timer = QTimer(self)
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.setInterval(500)
+        self.config_save_timer.timeout.connect(lambda: save_config(self.cfg))
+        # Selection changes while scrolling restart this timer, so images load only once it settles.
+        self.image_timer = QTimer(self)
+        self.image_timer.setSingleShot(True)
+        self.image_timer.setInterval(70)
+        self.image_timer.timeout.connect(self.update_image_tabs)
+        self.roms_list.currentRowChanged.connect(lambda row: self.image_timer.start())
+        # Image folders are listed once; the watcher drops a listing when its folder changes.
+        self.image_dir_watcher = QFileSystemWatcher(self)
+        self.image_dir_watcher.directoryChanged.connect(self.on_image_dir_changed)
+        self.watched_image_dirs = set()
+        self.pixmap_prefetcher = PixmapPrefetcher(self)
         self.update_rom_list()
+        QTimer.singleShot(0, self.warm_rom_cache)
 
         pygame.init()
         pygame.joystick.init()
-        self.joystick = pygame.joystick.Joystick(0) if pygame.joystick.get_count() > 0 else None
-        if self.joystick:
-            self.joystick.init()
-        self.last_hat = (0, 0)
-        self.last_hat_held = {"left": False, "right": False, "up": False, "down": False}
-        self.last_hat_held_time = {"left": 0, "right": 0, "up": 0, "down": 0}
+        self.joystick_input = JoystickInput()
+        self.hat_repeat = {"left": RepeatState(), "right": RepeatState(), "up": RepeatState(), "down": RepeatState()}
+        self.key_repeat = {"left": RepeatState(), "right": RepeatState()}
         self.last_key_held = {"left": False, "right": False}
-        self.last_key_held_time = {"left": 0, "right": 0}
-        self.last_button_states = {}
         self.last_button_times = {}
-        self.debounce_delay = 200
+        self.debounce_ns = 200_000_000
         self.timer = QTimer(self)
+        self.timer.setInterval(20)
         self.timer.timeout.connect(self.poll_joystick)
-        self.timer.start(20)
+        # Without a joystick the fast timer is stopped; this slow one only watches for hotplug.
+        self.hotplug_timer = QTimer(self)
+        self.hotplug_timer.setInterval(1000)
+        self.hotplug_timer.timeout.connect(self.check_joystick_hotplug)
+        self.hotplug_timer.start()
+        self.update_poll_timer()
 
         self.is_fullscreen = False
         self.installEventFilter(self)
@@ -802,6 +1258,42 @@ class MainWindow(QMainWindow):
 
         self.img_tabs.setVisible(not self.cfg.get("display_only_rom_list", False))
 
+    def warm_rom_cache(self):
+        """Build the ROM lists of all configured systems on worker threads so switching systems is instant."""
+        jobs = []
+        for sys_cfg in reversed(TAB_CONFIGS):
+            sys_name = sys_cfg["name"]
+            roms_dir = self.cfg["roms_dirs"].get(sys_name, "")
+            if roms_dir:
+                jobs.append((sys_cfg["rom_titles_file"], roms_dir, sys_name, self.cfg["xml_dat_files"].get(sys_name, "")))
+
+        def worker():
+            while not self.warm_stop.is_set():
+                try:
+                    args = jobs.pop()
+                except IndexError:
+                    return
+                try:
+                    get_rom_list_cached(*args, self.rom_cache)
+                except Exception:
+                    # The UI thread rebuilds the list (and reports problems) when the system is selected.
+                    pass
+
+        # Daemon threads, so closing the window never waits for a DAT parse still in progress.
+        for _ in range(min(4, os.cpu_count() or 1, len(jobs))):
+            threading.Thread(target=worker, daemon=True).start()
+
+    def closeEvent(self, event):
+        self.warm_stop.set()
+        self.pixmap_prefetcher.shutdown()
+        if self.favorites_save_timer.isActive():
+            self.favorites_save_timer.stop()
+            save_favorites(self.cfg)
+        if self.config_save_timer.isActive():
+            self.config_save_timer.stop()
+            save_config(self.cfg)
+        super().closeEvent(event)
+
     def adjust_main_window_size(self):
         self.setMinimumSize(400, 320)
         self.resize(self.sizeHint())
@@ -809,16 +1301,17 @@ class MainWindow(QMainWindow):
 
     def toggle_hide_clones(self, checked):
         self.cfg["hide_clones"] = checked
-        save_config(self.cfg)
+        self.config_save_timer.start()
         self.update_rom_list()
 
     def show_about(self):
-        dlg = AboutDialog(self)
-        dlg.exec()
+        if self.about_dialog is None:
+            self.about_dialog = AboutDialog(self)
+        self.about_dialog.exec()
 
     def show_favorites(self):
         if self.favorites_dialog is None:
-            self.favorites_dialog = FavoritesDialog(self.cfg, self, self.current_system)
+            self.favorites_dialog = FavoritesDialog(self.cfg, self, self.favorites_save_timer.start, self.joystick_input)
             self.favorites_dialog.finished.connect(self.on_favorites_dialog_closed)
             self.favorites_dialog.exec()
         else:
@@ -826,10 +1319,12 @@ class MainWindow(QMainWindow):
 
     def on_favorites_dialog_closed(self):
         self.favorites_dialog = None
+        # The dialog may have removed entries.
+        self.favorites_set = set(map(tuple, self.cfg["favorites"]))
 
     def show_context_menu(self, position):
         idx = self.roms_list.currentRow()
-        if idx < 0 or not self.roms or self.roms_list.item(idx).text() == "No ROMs found.":
+        if idx < 0 or not self.roms:
             return
 
         menu = QMenu()
@@ -840,17 +1335,18 @@ class MainWindow(QMainWindow):
             self.add_to_favorites(idx)
 
     def add_to_favorites(self, idx):
-        sys_cfg, _ = self.current_system()
-        sys_name = sys_cfg["name"]
-        rom, title, year, manuf, is_clone = self.roms[idx]
-        favorite = (sys_name, rom, title, year, manuf)
-        if favorite not in self.cfg["favorites"]:
-            self.cfg["favorites"].append(favorite)
-            save_config(self.cfg)
+        rom, title, year, manuf = self.roms[idx][:4]
+        favorite = (self.sys_ctx.name, rom, title, year, manuf)
+        if favorite not in self.favorites_set:
+            self.favorites_set.add(favorite)
+            self.cfg["favorites"].append(list(favorite))
+            self.favorites_save_timer.start()
             QMessageBox.information(self, "Favorites", f"Added '{title}' to favorites.")
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.Type.WindowActivate:
+            if not self.is_active:
+                self.joystick_input.discard_pending()
             self.is_active = True
         elif event.type() == QEvent.Type.WindowDeactivate:
             self.is_active = False
@@ -866,11 +1362,11 @@ class MainWindow(QMainWindow):
                 return True
             if event.key() == Qt.Key.Key_Left:
                 self.last_key_held["left"] = True
-                self.last_key_held_time["left"] = time.time() * 1000
+                self.update_poll_timer()
                 return True
             if event.key() == Qt.Key.Key_Right:
                 self.last_key_held["right"] = True
-                self.last_key_held_time["right"] = time.time() * 1000
+                self.update_poll_timer()
                 return True
         elif event.type() == QEvent.Type.KeyRelease and obj == self.roms_list:
             if event.key() == Qt.Key.Key_Left:
@@ -891,171 +1387,188 @@ class MainWindow(QMainWindow):
 
     def update_image_tabs(self):
         idx = self.roms_list.currentRow()
-        if idx < 0 or not self.roms or self.roms_list.item(idx).text() == "No ROMs found.":
+        if idx < 0 or not self.roms:
             self.title_img_label.setPixmap(None)
             self.preview_img_label.setPixmap(None)
             return
-        rom = self.roms[idx][0]
-        sys_cfg = self.current_system()[0]
-        sys_name = sys_cfg["name"]
-        prefix = self.SYSTEM_IMAGE_PREFIXES.get(sys_name, "")
-        base_name = Path(rom).stem.lower()
-        title_filename = f"{prefix}{base_name}.png"
-        preview_filename = f"{prefix}{base_name}.png"
-        title_dir = self.cfg["title_image_dirs"].get(sys_name, "")
-        preview_dir = self.cfg["preview_image_dirs"].get(sys_name, "")
-        title_path = find_file_case_insensitive(title_dir, title_filename) if title_dir else None
-        preview_path = find_file_case_insensitive(preview_dir, preview_filename) if preview_dir else None
+        title_path, preview_path = self.image_paths(self.roms[idx][0])
         if title_path:
-            self.title_img_label.setPixmap(QPixmap(title_path))
+            self.title_img_label.setPixmap(load_pixmap(title_path))
         else:
             self.title_img_label.setPixmap(None)
         if preview_path:
-            self.preview_img_label.setPixmap(QPixmap(preview_path))
+            self.preview_img_label.setPixmap(load_pixmap(preview_path))
         else:
             self.preview_img_label.setPixmap(None)
-
-    def current_system(self):
-        idx = self.systems_combo.currentIndex()
-        sys_cfg = TAB_CONFIGS[idx]
-        roms_dir = self.cfg["roms_dirs"].get(sys_cfg["name"], "")
-        return sys_cfg, roms_dir
+        # Decode the neighbours' images in the background so the next scroll step finds them cached.
+        paths = []
+        for offset in range(1, self.IMAGE_PREFETCH_ROWS + 1):
+            for row in (idx + offset, idx - offset):
+                if 0 <= row < len(self.roms):
+                    paths.extend(path for path in self.image_paths(self.roms[row][0]) if path)
+        self.pixmap_prefetcher.prefetch(paths)
+
+    def image_paths(self, rom):
+        ctx = self.sys_ctx
+        base_name = os.path.splitext(os.path.basename(rom))[0].lower()
+        title_filename = f"{ctx.image_prefix}{base_name}.png"
+        preview_filename = f"{ctx.image_prefix}{base_name}.png"
+        title_dir = ctx.title_dir
+        preview_dir = ctx.preview_dir
+        title_path = self.find_image(title_dir, title_filename) if title_dir else None
+        preview_path = self.find_image(preview_dir, preview_filename) if preview_dir else None
+        return title_path, preview_path
+
+    def find_image(self, directory, filename):
+        if directory not in self.watched_image_dirs and os.path.isdir(directory):
+            self.image_dir_watcher.addPath(directory)
+            self.watched_image_dirs.add(directory)
+        return find_file_case_insensitive(directory, filename)
+
+    def on_image_dir_changed(self, directory):
+        invalidate_dir_index(directory)
+        # The watcher stops watching a removed folder; watch it again if it comes back.
+        if not os.path.isdir(directory):
+            self.watched_image_dirs.discard(directory)
+        self.image_timer.start()
+
+    def update_system_context(self):
+        """Resolve the selected system's settings once, instead of on every list or image update."""
+        sys_cfg = TAB_CONFIGS[self.systems_combo.currentIndex()]
+        sys_name = sys_cfg["name"]
+        self.sys_ctx = SimpleNamespace(
+            cfg=sys_cfg,
+            name=sys_name,
+            roms_dir=self.cfg["roms_dirs"].get(sys_name, ""),
+            xml_file=self.cfg["xml_dat_files"].get(sys_name, ""),
+            image_prefix=self.SYSTEM_IMAGE_PREFIXES.get(sys_name, ""),
+            title_dir=self.cfg["title_image_dirs"].get(sys_name, ""),
+            preview_dir=self.cfg["preview_image_dirs"].get(sys_name, ""),
+        )
 
     def update_rom_list(self):
-        sys_cfg = self.current_system()[0]
-        sys_name = sys_cfg["name"]
-        roms_dir = self.cfg["roms_dirs"].get(sys_name, "")
-        rom_titles_file = sys_cfg["rom_titles_file"]
+        ctx = self.sys_ctx
         search = self.search_edit.text().lower()
-        xml_file = self.cfg["xml_dat_files"].get(sys_name, "")
         year_filter = self.year_edit.text().strip()
         manuf_filter = self.manuf_edit.text().strip()
         hide_clones = self.hide_clones_chk.isChecked()
         all_roms = get_rom_list_cached(
-            rom_titles_file, roms_dir, sys_name, xml_file, self.rom_cache
+            ctx.cfg["rom_titles_file"], ctx.roms_dir, ctx.name, ctx.xml_file, self.rom_cache
         )
-        self.roms = filter_rom_list(all_roms, search, year_filter, manuf_filter, hide_clones)
-        self.roms_list.clear()
-        for _, title, year, manuf, is_clone in self.roms:
-            display = title
-            if year or manuf:
-                display += f" [{year}]" if year else ""
-                display += f" ({manuf})" if manuf else ""
-            self.roms_list.addItem(display)
+        prefix = self.cfg.get("search_prefix_only", False)
+        # Nothing to do if neither the inputs nor the underlying ROM list changed since the last rebuild,
+        # e.g. the second refresh after the Settings dialog is saved.
+        filter_key = (ctx, all_roms, search, year_filter, manuf_filter, hide_clones, prefix)
+        if filter_key == self.last_filter_key:
+            return
+        self.last_filter_key = filter_key
+        indices = filter_rom_indices(all_roms, search, year_filter, manuf_filter, hide_clones, prefix)
+        self.roms, texts = all_roms.select(indices)
+        self.roms_model.setStringList(texts or ["No ROMs found."])
         count = len(self.roms)
         self.rom_count_label.setText(f"ROMs found: {count}")
-        if not self.roms_list.count():
-            self.roms_list.addItem("No ROMs found.")
         self.update_image_tabs()
 
     def launch_selected_rom(self, *args):
         idx = self.roms_list.currentRow()
-        if idx < 0 or not self.roms or self.roms_list.item(idx).text() == "No ROMs found.":
+        if idx < 0 or not self.roms:
             QMessageBox.critical(self, "Warning", "Select a ROM.")
             return
         rom = self.roms[idx][0]
-        sys_cfg = self.current_system()[0]
-        sys_name = sys_cfg["name"]
-        run_rom(rom, self.cfg["roms_dirs"].get(sys_name, ""), self.cfg["RETROARCH"], self.cfg["RETROARCH_CORE"], sys_name, self)
+        run_rom(rom, self.sys_ctx.roms_dir, self.cfg["RETROARCH"], self.cfg["RETROARCH_CORE"], self.sys_ctx.name, self)
 
     def show_settings(self):
-        dlg = SettingsDialog(
-            self.cfg,
-            self,
-            self.current_system,
-            self.update_rom_list
-        )
-        if dlg.exec():
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(
+                self.cfg,
+                self,
+                self.apply_settings
+            )
+        else:
+            self.settings_dialog.reset_from_cfg()
+        if self.settings_dialog.exec():
             self.img_tabs.setVisible(not self.cfg.get("display_only_rom_list", False))
             self.update_rom_list()
 
+    def apply_settings(self):
+        self.update_system_context()
+        self.update_rom_list()
+
+    def update_poll_timer(self):
+        """Run the 20 ms input timer only while a joystick is connected or a scroll key is held."""
+        needed = self.joystick_input.joystick is not None or any(self.last_key_held.values())
+        if needed and not self.timer.isActive():
+            self.timer.start()
+        elif not needed and self.timer.isActive():
+            self.timer.stop()
+
+    def check_joystick_hotplug(self):
+        if not self.timer.isActive():
+            self.joystick_input.read()
+            self.update_poll_timer()
+
     def poll_joystick(self):
         if not self.isActiveWindow() or not self.is_active:
             return
-        pygame.event.pump()
+        buttons = self.joystick_input.read()
+        if self.joystick_input.joystick is None and not any(self.last_key_held.values()):
+            self.update_poll_timer()
+            return
         jc = self.cfg["joystick_config"]
         fastest_steps = jc.get("hat_fastest_steps", 10)
-        fastest_delay = jc.get("hat_fastest_delay", 0.02)
-        scroll_cooldown = jc.get("hat_scroll_cooldown", 0.08)
-        now = time.time() * 1000
+        fastest_delay = int(jc.get("hat_fastest_delay", 0.02) * 1_000_000_000)
+        # A held left/right first repeats after fastest_delay, then pages every 50 ms;
+        # delays above 200 ms are capped and page every 200 ms instead.
+        if fastest_delay > 200_000_000:
+            fastest_delay = fastest_interval = 200_000_000
+        else:
+            fastest_interval = 50_000_000
+        scroll_cooldown = int(jc.get("hat_scroll_cooldown", 0.08) * 1_000_000_000)
+        now = time.monotonic_ns()
         list_widget = self.roms_list
-        idx = list_widget.currentRow()
-        size = list_widget.count()
-
-        def scroll_list(direction, steps, held_key, held_time_key, is_keyboard=False):
-            state_dict = self.last_key_held if is_keyboard else self.last_hat_held
-            time_dict = self.last_key_held_time if is_keyboard else self.last_hat_held_time
-            if direction:
-                if not state_dict.get(held_key, False):
-                    list_widget.setCurrentRow(max(0, idx - steps) if held_key == "left" else min(size - 1, idx + steps))
-                    state_dict[held_key] = True
-                    time_dict[held_key] = now
-                elif now - time_dict.get(held_key, 0) > fastest_delay * 1000:
-                    list_widget.setCurrentRow(max(0, list_widget.currentRow() - steps) if held_key == "left" else min(size - 1, list_widget.currentRow() + steps))
-                    time_dict[held_key] = now - (fastest_delay * 1000 - 50)
-                elif now - time_dict.get(held_key, 0) > 200:
-                    list_widget.setCurrentRow(max(0, list_widget.currentRow() - steps) if held_key == "left" else min(size - 1, list_widget.currentRow() + steps))
-                    time_dict[held_key] = now
-            else:
-                state_dict[held_key] = False
-
-        if self.joystick and self.joystick.get_numhats() > 0:
-            hat = self.joystick.get_hat(0)
-            hat_up = hat[1] == 1
-            hat_down = hat[1] == -1
-            hat_left = hat[0] == -1
-            hat_right = hat[0] == 1
-
-            if hat_up:
-                if not self.last_hat_held.get("up", False):
-                    list_widget.setCurrentRow(max(0, idx - 1))
-                    self.last_hat_held_time["up"] = now
-                    self.last_hat_held["up"] = True
-                elif now - self.last_hat_held_time["up"] >= scroll_cooldown * 1000:
-                    list_widget.setCurrentRow(max(0, list_widget.currentRow() - 1))
-                    self.last_hat_held_time["up"] = now
-            else:
-                self.last_hat_held["up"] = False
-
-            if hat_down:
-                if not self.last_hat_held.get("down", False):
-                    list_widget.setCurrentRow(min(size - 1, idx + 1))
-                    self.last_hat_held_time["down"] = now
-                    self.last_hat_held["down"] = True
-                elif now - self.last_hat_held_time["down"] >= scroll_cooldown * 1000:
-                    list_widget.setCurrentRow(min(size - 1, list_widget.currentRow() + 1))
-                    self.last_hat_held_time["down"] = now
-            else:
-                self.last_hat_held["down"] = False
-
-            scroll_list(hat_left, fastest_steps, "left", "left", is_keyboard=False)
-            scroll_list(hat_right, fastest_steps, "right", "right", is_keyboard=False)
 
-            self.last_hat = hat
-
-        scroll_list(self.last_key_held.get("left", False), fastest_steps, "left", "left", is_keyboard=True)
-        scroll_list(self.last_key_held.get("right", False), fastest_steps, "right", "right", is_keyboard=True)
+        # Row moves from the hat, arrow keys and buttons add up, so the selection changes once per tick.
+        delta = 0
+        # Up/down move one row per hat_scroll_cooldown; left/right (hat or arrow keys) jump fastest_steps rows.
+        hat = self.joystick_input.hat if self.joystick_input.joystick else (0, 0)
+        for state, pressed, step, delay, interval in (
+            (self.hat_repeat["up"], hat[1] == 1, -1, scroll_cooldown, scroll_cooldown),
+            (self.hat_repeat["down"], hat[1] == -1, 1, scroll_cooldown, scroll_cooldown),
+            (self.hat_repeat["left"], hat[0] == -1, -fastest_steps, fastest_delay, fastest_interval),
+            (self.hat_repeat["right"], hat[0] == 1, fastest_steps, fastest_delay, fastest_interval),
+            (self.key_repeat["left"], self.last_key_held["left"], -fastest_steps, fastest_delay, fastest_interval),
+            (self.key_repeat["right"], self.last_key_held["right"], fastest_steps, fastest_delay, fastest_interval),
+        ):
+            if state.advance(pressed, now, delay, interval):
+                delta += step
+
+        if buttons:
+            if self.check_button("button_up", buttons, now):
+                delta -= 1
+            if self.check_button("button_down", buttons, now):
+                delta += 1
+        if delta:
+            list_widget.moveCurrentRow(delta)
+        if buttons:
+            if self.check_button("button_select", buttons, now):
+                self.launch_selected_rom()
+            if self.check_button("button_favorites", buttons, now):
+                self.show_favorites()
+            if self.check_button("button_prev_tab", buttons, now):
+                self.systems_combo.setCurrentIndex((self.systems_combo.currentIndex() - 1) % self.systems_combo.count())
+            if self.check_button("button_next_tab", buttons, now):
+                self.systems_combo.setCurrentIndex((self.systems_combo.currentIndex() + 1) % self.systems_combo.count())
+
+    def check_button(self, btn_key, buttons, now):
+        """Return True if the button mapped to btn_key was pressed, at most once per debounce period."""
+        button = self.cfg["joystick_config"].get(btn_key, -1)
+        fired = False
+        for pressed_button, pressed in buttons:
+            if pressed and pressed_button == button and now - self.last_button_times.get(btn_key, 0) >= self.debounce_ns:
+                fired = True
+                self.last_button_times[btn_key] = now
+        return fired
 
-        def check_button(btn_key, action):
-            idx = jc.get(btn_key, -1)
-            if idx < 0 or idx >= self.joystick.get_numbuttons():
-                return
-            pressed = self.joystick.get_button(idx)
-            last_time = self.last_button_times.get(btn_key, 0)
-            if pressed and not self.last_button_states.get(btn_key, False):
-                if now - last_time >= self.debounce_delay:
-                    action()
-                    self.last_button_times[btn_key] = now
-            self.last_button_states[btn_key] = pressed
-
-        if self.joystick:
-            check_button("button_up", lambda: self.roms_list.setCurrentRow(max(0, self.roms_list.currentRow() - 1)))
-            check_button("button_down", lambda: self.roms_list.setCurrentRow(min(self.roms_list.count() - 1, self.roms_list.currentRow() + 1)))
-            check_button("button_select", self.launch_selected_rom)
-            check_button("button_favorites", self.show_favorites)
-            check_button("button_prev_tab", lambda: self.systems_combo.setCurrentIndex((self.systems_combo.currentIndex() - 1) % self.systems_combo.count()))
-            check_button("button_next_tab", lambda: self.systems_combo.setCurrentIndex((self.systems_combo.currentIndex() + 1) % self.systems_combo.count()))
-            
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     win = MainWindow()